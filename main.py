@@ -1,6 +1,5 @@
 import logging
 from pathlib import Path
-import pandas as pd
 from weather_loader import WeatherLoader
 from weather_stats import WeatherProcessor, WeatherStatsIterator
 from weather_storage import WeatherStorage
@@ -28,23 +27,23 @@ if __name__ == "__main__":
         # 2) Concurrent load
         logger.info("Loading weather data concurrently")
         multi_loader = WeatherLoader(files)
-        dfs = multi_loader.load_concurrent(max_workers=4)
+        dfs = multi_loader.load_concurrent(max_workers=4, validate=True)
         logger.info(f"Concurrent load OK: {len(dfs)} files")
 
         # Combine all DataFrames before processing/saving
-        combined_df = pd.concat(dfs, ignore_index=True)
+        combined_df = multi_loader.concat(dfs)
         logger.info(f"Combined rows: {len(combined_df)}")
 
         # 3) Process data
         logger.info("Processing data")
-        processor = WeatherProcessor(combined_df)
+        processor = WeatherProcessor(combined_df, report=multi_loader.report)
         processor.print_descriptive_stats()
         processor.visualize_data()
 
         # 4) Save stats
         logger.info("Saving statistics")
         storage = WeatherStorage()
-        storage.save_stats(combined_df)
+        storage.save_stats(combined_df, report=multi_loader.report)
 
         # iterate a few rows using iterator
         it = WeatherStatsIterator(combined_df.head(5))
@@ -23,4 +23,76 @@ def test_load_file_not_found():
 def test_exception():
     with pytest.raises(Exception):
         loader = WeatherLoader("non_existent_file.csv")
-        loader.load()
\ No newline at end of file
+        loader.load()
+
+def test_load_with_projection_and_filters(csv_file):
+    loader = WeatherLoader(csv_file)
+    df = loader.load(columns=["col2"], filters=[("col1", ">", 1)])
+    assert list(df.columns) == ["col2"]
+    assert df["col2"].tolist() == [4]
+
+def test_unknown_engine(csv_file):
+    with pytest.raises(ValueError):
+        WeatherLoader(csv_file, engine="not_an_engine")
+
+def test_load_polars_engine(csv_file):
+    pl = pytest.importorskip("polars")
+    loader = WeatherLoader(csv_file, engine="polars")
+    df = loader.load(columns=["col2"], filters=[("col1", ">", 1)])
+    assert isinstance(df, pl.DataFrame)
+    assert df["col2"].to_list() == [4]
+
+def test_load_validated_in_chunks(tmp_path):
+    file_path = tmp_path / "weather.csv"
+    file_path.write_text("Location,Humidity9am\nA,50\nNA,150\nB,\nC,70\nD,80")
+    loader = WeatherLoader(file_path)
+    df = loader.load(validate=True, chunksize=2)
+    assert len(df) == 5
+    assert loader.report.rows == 5
+    assert loader.report.out_of_range == {"Humidity9am": 1}
+    assert loader.report.null_counts == {"Location": 1, "Humidity9am": 2}
+
+def test_load_concurrent_validated(tmp_path):
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"weather{i}.csv"
+        path.write_text("Humidity9am\n50\n150")
+        paths.append(path)
+    loader = WeatherLoader(paths)
+    df = loader.concat(loader.load_concurrent(max_workers=2, validate=True))
+    assert len(df) == 4
+    assert loader.report.null_masks["Humidity9am"].tolist() == [False, True, False, True]
+
+def test_unvalidated_load_clears_report(tmp_path):
+    path = tmp_path / "weather.csv"
+    path.write_text("Humidity9am\n50\n150")
+    loader = WeatherLoader([path, path])
+    loader.load_concurrent(validate=True)
+    assert loader.report is not None
+    loader.concat(loader.load_concurrent(validate=False))
+    assert loader.report is None
+
+def test_load_polars_validated_in_chunks(tmp_path):
+    pytest.importorskip("polars")
+    file_path = tmp_path / "weather.csv"
+    file_path.write_text("Location,Humidity9am\nA,50\nNA,150\nB,\nC,70\nD,80")
+    loader = WeatherLoader(file_path, engine="polars")
+    df = loader.load(validate=True, chunksize=2)
+    assert df.height == 5
+    assert loader.report.out_of_range == {"Humidity9am": 1}
+    assert loader.report.null_counts == {"Location": 1, "Humidity9am": 2}
+
+def test_polars_reads_missing_tokens_as_null(tmp_path):
+    pytest.importorskip("polars")
+    from weather_stats import WeatherProcessor
+    file_path = tmp_path / "weather.csv"
+    file_path.write_text("Location,MinTemp,Rainfall\nA,12.5,NA\nB,NA,1.0\nC,8,0.2")
+
+    expected = list(WeatherProcessor(WeatherLoader(file_path).load()).generate_stats())
+    df = WeatherLoader(file_path, engine="polars").load()
+    assert [s["column"] for s in expected] == ["MinTemp", "Rainfall"]
+    assert list(WeatherProcessor(df).generate_stats()) == expected
+
+    for validate in (False, True):
+        filtered = WeatherLoader(file_path, engine="polars").load(filters=[("MinTemp", ">", 10)], validate=validate)
+        assert filtered["Location"].to_list() == ["A"]
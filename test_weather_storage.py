@@ -26,3 +26,26 @@ def test_save_stats_success(sample_dataframe, tmp_path):
     # Read the file back and check if the content is correct
     saved_df = pd.read_csv(temp_file)
     pd.testing.assert_frame_equal(saved_df, sample_dataframe)
+
+def test_save_stats_polars(tmp_path):
+    """Tests that a Polars frame is written with the Polars engine."""
+    pl = pytest.importorskip("polars")
+    temp_file = tmp_path / "test_stats.csv"
+
+    WeatherStorage(out_file=temp_file).save_stats(pl.DataFrame({'col1': [1, 2], 'col2': [3, 4]}))
+
+    saved_df = pd.read_csv(temp_file)
+    pd.testing.assert_frame_equal(saved_df, pd.DataFrame({'col1': [1, 2], 'col2': [3, 4]}))
+
+def test_save_stats_with_validation_report(sample_dataframe, tmp_path):
+    """Tests that a validation summary is written next to the stats file."""
+    from weather_stats.validation import validate_frame
+    temp_file = tmp_path / "test_stats.csv"
+    df, report = validate_frame(sample_dataframe)
+
+    storage = WeatherStorage(out_file=temp_file)
+    storage.save_stats(df, report=report)
+
+    summary = pd.read_csv(tmp_path / "test_stats_validation.csv")
+    assert summary['column'].tolist() == ['col1', 'col2']
+    assert summary['nulls'].tolist() == [0, 0]
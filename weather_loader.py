@@ -1,11 +1,12 @@
-import pandas as pd
 from concurrent.futures import ThreadPoolExecutor
 import time
 from pathlib import Path
 from collections.abc import Iterable
+from weather_stats.engine import get_engine
+from weather_stats.validation import ValidationReport, validate_frame
 
 class WeatherLoader:
-    def __init__(self, file_paths):
+    def __init__(self, file_paths, engine="pandas"):
         # Always store as a list of strings
         if isinstance(file_paths, (str, Path)):
             self.file_paths = [str(file_paths)]
@@ -13,21 +14,77 @@ class WeatherLoader:
             self.file_paths = [str(p) for p in file_paths]
         else:
             raise TypeError("file_paths must be a path or an iterable of paths/strings")
+        self.engine = get_engine(engine)
+        # ValidationReport of the last load when validate=True, else None
+        self.report = None
 
-    def load(self):
-        """Sequentially load one CSV file (original behavior)."""
+    def load(self, columns=None, filters=None, validate=False, chunksize=100_000):
+        """
+        Sequentially load one CSV file (original behavior).
+
+        columns: optional list of columns to keep (projection)
+        filters: optional list of (column, op, value) tuples, e.g. [("Location", "==", "Albury")]
+        validate: read in chunks of chunksize rows and run validate_frame() on each;
+                  the combined ValidationReport is stored in self.report
+        """
         path = self.file_paths[0]
         try:
-            df = pd.read_csv(path)
+            if validate:
+                df, self.report = self._load_validated(path, columns, filters, chunksize)
+                return df
+            self.report = None
+            df = self.engine.read_csv(path, columns=columns, filters=filters)
             return df
         except Exception as e:
             print(f"Error loading {path}: {e}")
             raise
 
-    def load_concurrent(self, max_workers: int = 3):
-        """Load multiple CSV files concurrently (I/O concurrency)."""
+    def _load_validated(self, path, columns, filters, chunksize):
+        """Validate each chunk once as it is read, then combine frames and reports."""
+        chunks = []
+        report = ValidationReport()
+        for chunk in self.engine.read_csv_chunks(path, chunksize, columns=columns, filters=filters):
+            chunk, chunk_report = validate_frame(chunk, engine=self.engine)
+            chunks.append(chunk)
+            report = report.merge(chunk_report)
+        df = self.engine.concat(chunks)
+        return df, report.bind(df)
+
+    def load_concurrent(self, max_workers: int = 3, columns=None, filters=None, validate=False, chunksize=100_000):
+        """
+        Load multiple CSV files concurrently (I/O concurrency).
+
+        With validate=True the per-file reports are merged into self.report in
+        file order, which is the row order of concat(dfs).
+        """
         start = time.time()
+        self.report = None
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            dfs = list(executor.map(pd.read_csv, self.file_paths))
+            if validate:
+                results = list(executor.map(
+                    lambda path: self._load_validated(path, columns, filters, chunksize),
+                    self.file_paths
+                ))
+                dfs = [df for df, _ in results]
+                report = ValidationReport()
+                for _, file_report in results:
+                    report = report.merge(file_report)
+                self.report = report
+            else:
+                dfs = list(executor.map(
+                    lambda path: self.engine.read_csv(path, columns=columns, filters=filters),
+                    self.file_paths
+                ))
         print(f"Loaded {len(dfs)} files concurrently in {time.time() - start:.2f} seconds")
-        return dfs
\ No newline at end of file
+        return dfs
+
+    def concat(self, dfs):
+        """
+        Combine frames returned by load_concurrent() using the loader's engine.
+
+        If those frames were validated, self.report is bound to the combined frame.
+        """
+        df = self.engine.concat(dfs)
+        if self.report is not None:
+            self.report.bind(df)
+        return df
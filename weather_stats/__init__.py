@@ -1,3 +1,4 @@
-from .stats import WeatherProcessor, WeatherStatsIterator
+from .stats import WeatherProcessor, WeatherStatsIterator, parallel_column_stats
+from .validation import ValidationReport, validate_frame
 
-__all__ = ["WeatherProcessor", "WeatherStatsIterator"]
\ No newline at end of file
+__all__ = ["WeatherProcessor", "WeatherStatsIterator", "parallel_column_stats", "ValidationReport", "validate_frame"]
\ No newline at end of file
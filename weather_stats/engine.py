@@ -0,0 +1,272 @@
+import logging
+import operator
+import numpy as np
+import pandas as pd
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional
+    pl = None
+
+logger = logging.getLogger(__name__)
+
+# Strings that mean "no reading" in the raw CSVs; both engines read them as missing
+MISSING_TOKENS = ["", "NA", "N/A", "NaN", "nan", "None", "null", "-"]
+
+# Filters are (column, op, value) tuples combined with AND, e.g. [("Location", "==", "Albury")]
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _check_filters(filters):
+    for col, op, _ in filters or []:
+        if op not in _OPERATORS and op != "in":
+            raise ValueError(f"Unsupported filter operator '{op}' for column '{col}'")
+
+
+class PandasEngine:
+    """Eager pandas backend (original behavior)"""
+    name = "pandas"
+
+    def _usecols(self, columns, filters):
+        if columns is None:
+            return None
+        return list(dict.fromkeys(list(columns) + [col for col, _, _ in filters or []]))
+
+    def read_csv(self, path, columns=None, filters=None):
+        """Read a CSV, reading only the projected + filtered columns"""
+        _check_filters(filters)
+        df = pd.read_csv(path, usecols=self._usecols(columns, filters), na_values=MISSING_TOKENS)
+        return self._apply(df, columns, filters)
+
+    def read_csv_chunks(self, path, chunksize, columns=None, filters=None):
+        """Yield the CSV in chunks of chunksize rows, filtering each chunk as it is read"""
+        _check_filters(filters)
+        for chunk in pd.read_csv(path, usecols=self._usecols(columns, filters), na_values=MISSING_TOKENS,
+                                 chunksize=chunksize):
+            yield self._apply(chunk, columns, filters)
+
+    def _apply(self, df, columns, filters):
+        if filters:
+            mask = np.ones(len(df), dtype=bool)
+            for col, op, value in filters:
+                if op == "in":
+                    mask &= df[col].isin(value).to_numpy()
+                else:
+                    mask &= _OPERATORS[op](df[col], value).to_numpy()
+            df = df[mask].reset_index(drop=True)
+        if columns is not None:
+            df = df[list(columns)]
+        return df
+
+    def write_csv(self, df, path):
+        df.to_csv(path, index=False)
+
+    def concat(self, dfs):
+        return pd.concat(dfs, ignore_index=True)
+
+    def numeric_columns(self, df):
+        return df.select_dtypes(include="number").columns.tolist()
+
+    def string_columns(self, df):
+        return df.select_dtypes(include=["object", "string"]).columns.tolist()
+
+    def is_integer(self, df, col):
+        return pd.api.types.is_integer_dtype(df[col])
+
+    def to_numeric(self, df, col):
+        """Coerce a column to numbers, turning unparseable values into NaN"""
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+        return df
+
+    def null_mask(self, df, col):
+        return df[col].isna().to_numpy()
+
+    def isin_mask(self, df, col, values):
+        return df[col].isin(values).to_numpy()
+
+    def set_null(self, df, col, mask):
+        df[col] = df[col].mask(mask)
+        return df
+
+    def column_array(self, df, col):
+        """Column as a float64 array with NaN for missing values"""
+        return df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def key_array(self, df, col):
+        """Column as an object array with None for missing values"""
+        keys = df[col].to_numpy(dtype=object, copy=True)
+        keys[pd.isna(keys)] = None
+        return keys
+
+    def column_stats(self, df, col, valid=None):
+        """
+        Return mean/median/mode/range for a column, or None if it has no data.
+
+        valid is an optional precomputed row selector (see ValidationReport.valid_rows);
+        without it missing values are found with dropna().
+        """
+        series = df[col].dropna() if valid is None else df[col][valid]
+        if series.empty:
+            return None
+
+        mode_val = series.mode()
+        mode_str = mode_val.iloc[0] if not mode_val.empty else "N/A"
+
+        return {
+            'column': col,
+            'mean': round(series.mean(), 2),
+            'median': round(series.median(), 2),
+            'mode': mode_str,
+            'range': round(series.max() - series.min(), 2)
+        }
+
+    def groups(self, df, col):
+        """Yield (key, sub-frame) pairs sorted by key, skipping missing keys"""
+        yield from df.groupby(col, sort=True)
+
+    def means(self, df, cols):
+        return df[cols].mean().dropna()
+
+
+class PolarsEngine:
+    """Lazy, multithreaded Polars backend"""
+    name = "polars"
+
+    def __init__(self):
+        if pl is None:
+            raise ImportError("The 'polars' engine requires polars: pip install polars")
+
+    def _expr(self, col, op, value):
+        if op == "in":
+            return pl.col(col).is_in(list(value))
+        return _OPERATORS[op](pl.col(col), value)
+
+    def _scan(self, path, columns, filters):
+        _check_filters(filters)
+        lazy = pl.scan_csv(path, null_values=MISSING_TOKENS)
+        for col, op, value in filters or []:
+            lazy = lazy.filter(self._expr(col, op, value))
+        if columns is not None:
+            lazy = lazy.select(list(columns))
+        return lazy
+
+    def read_csv(self, path, columns=None, filters=None):
+        """Scan a CSV lazily so the filters and projection are pushed into the reader"""
+        return self._scan(path, columns, filters).collect()
+
+    def read_csv_chunks(self, path, chunksize, columns=None, filters=None):
+        """Stream the filtered/projected scan in batches of chunksize rows"""
+        lazy = self._scan(path, columns, filters)
+        if hasattr(lazy, "collect_batches"):
+            yield from lazy.collect_batches(chunk_size=chunksize)
+        else:
+            # Older Polars has no streaming batch API: the whole frame is loaded
+            # first and validated in slices
+            yield from lazy.collect().iter_slices(chunksize)
+
+    def write_csv(self, df, path):
+        df.write_csv(path)
+
+    def concat(self, dfs):
+        return pl.concat(dfs, how="diagonal_relaxed")
+
+    def numeric_columns(self, df):
+        return [col for col, dtype in df.schema.items() if dtype.is_numeric()]
+
+    def string_columns(self, df):
+        return [col for col, dtype in df.schema.items() if dtype == pl.String]
+
+    def is_integer(self, df, col):
+        return df.schema[col].is_integer()
+
+    def to_numeric(self, df, col):
+        if not df.schema[col].is_numeric():
+            df = df.with_columns(pl.col(col).cast(pl.Float64, strict=False))
+        return df
+
+    def null_mask(self, df, col):
+        series = df[col]
+        mask = series.is_null()
+        if series.dtype.is_float():
+            mask = mask | series.is_nan().fill_null(False)
+        return mask.to_numpy()
+
+    def isin_mask(self, df, col, values):
+        return df[col].is_in(list(values)).fill_null(False).to_numpy()
+
+    def set_null(self, df, col, mask):
+        return df.with_columns(pl.when(pl.Series(mask)).then(None).otherwise(pl.col(col)).alias(col))
+
+    def column_array(self, df, col):
+        return df[col].cast(pl.Float64).fill_null(np.nan).to_numpy()
+
+    def key_array(self, df, col):
+        return np.array(df[col].to_list(), dtype=object)
+
+    def _valid(self, df, col):
+        series = df[col].drop_nulls()
+        if series.dtype.is_float():
+            series = series.drop_nans()
+        return series
+
+    def column_stats(self, df, col, valid=None):
+        if valid is None:
+            series = self._valid(df, col)
+        elif isinstance(valid, slice):
+            series = df[col][valid]
+        else:
+            series = df[col].filter(pl.Series(valid))
+        if series.is_empty():
+            return None
+
+        return {
+            'column': col,
+            'mean': round(series.mean(), 2),
+            'median': round(series.median(), 2),
+            'mode': series.mode().sort()[0],
+            'range': round(series.max() - series.min(), 2)
+        }
+
+    def groups(self, df, col):
+        df = df.filter(pl.col(col).is_not_null()).sort(col, maintain_order=True)
+        for (key,), group_df in df.group_by(col, maintain_order=True):
+            yield key, group_df
+
+    def means(self, df, cols):
+        values = {col: self._valid(df, col).mean() for col in cols}
+        return pd.Series(values, dtype="float64").dropna()
+
+
+ENGINES = {
+    "pandas": PandasEngine,
+    "polars": PolarsEngine,
+}
+
+
+def get_engine(engine=None, df=None):
+    """
+    Resolve an engine from a name, an engine instance, or the type of df.
+
+    With no explicit engine the backend is inferred from the frame, so a
+    Polars frame from WeatherLoader(engine="polars") flows through
+    WeatherProcessor and WeatherStorage without extra arguments.
+    """
+    if engine is None:
+        if df is not None and type(df).__module__.split(".")[0] == "polars":
+            engine = "polars"
+        else:
+            engine = "pandas"
+    if isinstance(engine, str):
+        try:
+            return ENGINES[engine]()
+        except KeyError:
+            raise ValueError(f"Unknown engine '{engine}'. Choose from: {', '.join(ENGINES)}") from None
+    return engine
@@ -1,42 +1,163 @@
 import logging
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
 import matplotlib.pyplot as plt
+from .engine import get_engine
 
 logger = logging.getLogger(__name__)
 
+
+def _shared_column_stats(task):
+    """Worker: compute stats for one column slice of the shared numeric block"""
+    shm_name, shape, row, start, stop, is_int = task
+    shm = shared_memory.SharedMemory(name=shm_name)
+    block = None
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        values = block[row, start:stop]
+        values = values[~np.isnan(values)]  # boolean mask copies out of the shared buffer
+        block = None
+        if values.size == 0:
+            return None
+
+        uniques, counts = np.unique(values, return_counts=True)
+        mode_val = uniques[np.argmax(counts)]
+
+        return {
+            'mean': round(float(values.mean()), 2),
+            'median': round(float(np.median(values)), 2),
+            'mode': int(mode_val) if is_int else float(mode_val),
+            'range': round(float(values.max() - values.min()), 2)
+        }
+    finally:
+        block = None
+        shm.close()
+
+
+def parallel_column_stats(df, columns=None, group_col=None, max_workers=None, engine=None):
+    """
+    Compute column statistics across a process pool.
+
+    The numeric block is copied once into shared memory (one contiguous row
+    per column) and workers attach to it by name, so no DataFrame is pickled.
+    When group_col is given, each (group, column) pair is a separate task over
+    the group's row range. Results are returned in deterministic order:
+    columns in DataFrame order, grouped by sorted group value.
+    """
+    engine = get_engine(engine, df)
+    if columns is None:
+        columns = engine.numeric_columns(df)
+    if not columns:
+        return []
+
+    # Row order for the shared block: all rows, or non-null groups sorted by key
+    order = None
+    if group_col is not None:
+        keys = engine.key_array(df, group_col)
+        valid = np.flatnonzero(keys != None)  # noqa: E711 - elementwise comparison
+        order = valid[np.argsort(keys[valid], kind="stable")]
+        keys = keys[order]
+        boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        stops = np.concatenate((boundaries, [len(keys)]))
+        ranges = [(keys[a], a, b) for a, b in zip(starts, stops)] if len(keys) else []
+        n_rows = len(keys)
+    else:
+        n_rows = len(df)
+        ranges = [(None, 0, n_rows)]
+
+    shape = (len(columns), n_rows)
+    shm = shared_memory.SharedMemory(create=True, size=max(len(columns) * n_rows * 8, 1))
+    block = None
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        for row, col in enumerate(columns):
+            values = engine.column_array(df, col)
+            block[row] = values if order is None else values[order]
+
+        is_int = [engine.is_integer(df, col) for col in columns]
+        labels = []
+        tasks = []
+        for group, start, stop in ranges:
+            for row, col in enumerate(columns):
+                labels.append((group, col))
+                tasks.append((shm.name, shape, row, start, stop, is_int[row]))
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunksize = max(1, len(tasks) // ((max_workers or 4) * 4))
+            outcomes = list(executor.map(_shared_column_stats, tasks, chunksize=chunksize))
+    finally:
+        block = None
+        shm.close()
+        shm.unlink()
+
+    results = []
+    for (group, col), outcome in zip(labels, outcomes):
+        if outcome is None:
+            logger.warning(f"Column '{col}' contains no numeric data after dropping NA values")
+            continue
+        stats = {'column': col, **outcome}
+        if group_col is not None:
+            stats = {group_col: group, **stats}
+        results.append(stats)
+    return results
+
+
+def _usable_report(report, df):
+    """Return the validation report if it was built for this exact df, else None"""
+    if report is None:
+        return None
+    if not report.covers(df):
+        logger.warning("Validation report was not produced for this DataFrame; falling back to dropna()")
+        return None
+    return report
+
+
 class WeatherProcessor:
-    def __init__(self, df):
+    def __init__(self, df, parallel=False, max_workers=None, engine=None, report=None):
         self.df = df
-        logger.debug("Initialized WeatherProcessor")
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.engine = get_engine(engine, df)
+        # Null masks from WeatherLoader validation, reused instead of dropna() per column
+        self.report = _usable_report(report, df)
+        logger.debug(f"Initialized WeatherProcessor ({self.engine.name} engine)")
         
     def __iter__(self):
         """Return iterator class"""
-        return WeatherStatsIterator(self.df)
+        return WeatherStatsIterator(self.df, parallel=self.parallel, max_workers=self.max_workers,
+                                    engine=self.engine, report=self.report)
     
     def generate_stats(self):
         """Generator that yields statistics for each numeric column"""
-        numeric_cols = self.df.select_dtypes(include="number").columns
+        if self.parallel:
+            yield from parallel_column_stats(self.df, max_workers=self.max_workers, engine=self.engine)
+            return
+
+        numeric_cols = self.engine.numeric_columns(self.df)
         
         for col in numeric_cols:
-            series = self.df[col].dropna()
-            if series.empty:
+            valid = self.report.valid_rows(col) if self.report else None
+            stats = self.engine.column_stats(self.df, col, valid=valid)
+            if stats is None:
                 logger.warning(f"Column '{col}' contains no numeric data after dropping NA values")
                 continue
-                
-            mode_val = series.mode()
-            mode_str = mode_val.iloc[0] if not mode_val.empty else "N/A"
-            
-            stats = {
-                'column': col,
-                'mean': round(series.mean(), 2),
-                'median': round(series.median(), 2),
-                'mode': mode_str,
-                'range': round(series.max() - series.min(), 2)
-            }
             
             logger.debug(f"Generated stats for column '{col}': {stats}")
             yield stats
 
+    def generate_group_stats(self, group_col="Location"):
+        """Generator that yields statistics for each numeric column per group (e.g. location)"""
+        if self.parallel:
+            yield from parallel_column_stats(self.df, group_col=group_col, max_workers=self.max_workers, engine=self.engine)
+            return
+
+        for group, group_df in self.engine.groups(self.df, group_col):
+            for stats in WeatherProcessor(group_df, engine=self.engine).generate_stats():
+                yield {group_col: group, **stats}
+
     def print_descriptive_stats(self):
         """Print descriptive statistics"""
         try:
@@ -65,7 +186,7 @@ class WeatherProcessor:
             return
 
         # Calculate the average for these columns
-        means = self.df[existing_cols].mean().dropna()
+        means = self.engine.means(self.df, existing_cols)
 
         # Plot as a bar chart
         plt.figure(figsize=(10, 6))
@@ -81,32 +202,40 @@ class WeatherProcessor:
 
 class WeatherStatsIterator(Iterator):
     """Iterator class for WeatherProcessor that iterates over weather statistics"""
-    def __init__(self, df):
+    def __init__(self, df, parallel=False, max_workers=None, engine=None, report=None):
         self.df = df
-        self.columns = df.select_dtypes(include="number").columns.tolist()
+        self.engine = get_engine(engine, df)
+        self.report = _usable_report(report, df)
+        self.columns = self.engine.numeric_columns(df)
         self.current = 0
         self.max_index = len(self.columns)
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self._results = None
         logger.debug("Initialized WeatherStatsIterator")
     
     def __next__(self):
+        if self.parallel:
+            # Compute every column in one parallel pass, then hand them out in order
+            if self._results is None:
+                self._results = parallel_column_stats(self.df, self.columns, max_workers=self.max_workers, engine=self.engine)
+                self.max_index = len(self._results)
+            if self.current >= self.max_index:
+                raise StopIteration
+            self.current += 1
+            return self._results[self.current - 1]
+
         if self.current >= self.max_index:
             raise StopIteration
             
         col = self.columns[self.current]
         self.current += 1
         
-        series = self.df[col].dropna() # Drop NA values
-        if series.empty:
+        valid = self.report.valid_rows(col) if self.report else None
+        stats = self.engine.column_stats(self.df, col, valid=valid)  # Drops NA values
+        if stats is None:
             logger.warning(f"Column '{col}' contains no numeric data after dropping NA values")
             return self.__next__()  # Skip to next column
-            
-        mode_val = series.mode()
-        mode_str = mode_val.iloc[0] if not mode_val.empty else "N/A"
         
-        return {
-            'column': col,
-            'mean': round(series.mean(), 2),
-            'median': round(series.median(), 2),
-            'mode': mode_str,
-            'range': round(series.max() - series.min(), 2)
-        }
+        return stats
+
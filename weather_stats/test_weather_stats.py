@@ -96,4 +96,52 @@ def test_visualize_data_returns_correct_means(monkeypatch):
     # MinTemp mean over [10, 12, 14] = 12.0
     # MaxTemp mean over [20, 22, 24] = 22.0
     assert round(float(means["MinTemp"]), 2) == 12.00
-    assert round(float(means["MaxTemp"]), 2) == 22.00
\ No newline at end of file
+    assert round(float(means["MaxTemp"]), 2) == 22.00
+
+def test_parallel_generate_stats_matches_serial(sample_dataframe):
+    """Tests that the parallel engine returns the same stats, in the same order, as the serial path."""
+    serial = list(WeatherProcessor(sample_dataframe).generate_stats())
+    parallel = list(WeatherProcessor(sample_dataframe, parallel=True, max_workers=2).generate_stats())
+
+    assert [s['column'] for s in parallel] == ['temp', 'humidity']
+    for expected, actual in zip(serial, parallel):
+        assert actual == expected
+
+def test_parallel_iterator(sample_dataframe):
+    """Tests that WeatherStatsIterator still works on top of the parallel engine."""
+    processor = WeatherProcessor(sample_dataframe, parallel=True, max_workers=2)
+    stats_list = list(iter(processor))
+
+    assert [s['column'] for s in stats_list] == ['temp', 'humidity']
+    assert stats_list[1]['median'] == 56.5
+
+def test_generate_group_stats_parallel_matches_serial():
+    """Tests per-location stats in both modes."""
+    df = pd.DataFrame({
+        'Location': ['B', 'A', 'B', 'A', None],
+        'MinTemp': [5, 10, 7, 12, 99],
+        'Rainfall': [0.0, np.nan, 1.5, np.nan, 2.0],
+    })
+    serial = list(WeatherProcessor(df).generate_group_stats())
+    parallel = list(WeatherProcessor(df, parallel=True, max_workers=2).generate_group_stats())
+
+    assert [(s['Location'], s['column']) for s in parallel] == [('A', 'MinTemp'), ('B', 'MinTemp'), ('B', 'Rainfall')]
+    assert parallel == serial
+
+def test_polars_engine_matches_pandas(sample_dataframe):
+    """Tests that a Polars frame yields the same stats as the pandas engine, serial and parallel."""
+    pl = pytest.importorskip("polars")
+    polars_df = pl.from_dict({col: sample_dataframe[col].tolist() for col in sample_dataframe.columns})
+
+    expected = list(WeatherProcessor(sample_dataframe).generate_stats())
+    assert list(WeatherProcessor(polars_df).generate_stats()) == expected
+    assert list(WeatherProcessor(polars_df, parallel=True, max_workers=2).generate_stats()) == expected
+
+def test_parallel_group_stats_object_keys():
+    """Tests grouping on an object-dtype key column with missing values."""
+    df = pd.DataFrame({
+        'Location': pd.Series(['B', 'A', None], dtype=object),
+        'MinTemp': [5, 10, 99],
+    })
+    stats = list(WeatherProcessor(df, parallel=True, max_workers=2).generate_group_stats())
+    assert [(s['Location'], s['mean']) for s in stats] == [('A', 10.0), ('B', 5.0)]
@@ -0,0 +1,87 @@
+import pytest
+import pandas as pd
+import numpy as np
+from weather_stats.validation import ValidationReport, validate_frame
+from weather_stats.stats import WeatherProcessor
+
+
+@pytest.fixture
+def raw_dataframe():
+    """Creates a DataFrame with missing tokens and impossible readings."""
+    data = {
+        'Location': ['A', 'NA', 'B', None],
+        'Humidity9am': [50, 150, np.nan, 70],
+        'Pressure9am': ['1010.5', '5', 'bad', '1020.5'],
+        'MinTemp': [10, 12, 14, 16],
+    }
+    return pd.DataFrame(data)
+
+def test_validate_frame_normalizes_and_flags(raw_dataframe):
+    """Tests missing-token normalization, range checks and null counts."""
+    df, report = validate_frame(raw_dataframe)
+
+    assert report.rows == 4
+    assert report.out_of_range == {'Humidity9am': 1, 'Pressure9am': 1}
+    assert report.null_counts == {'Location': 2, 'Humidity9am': 2, 'Pressure9am': 2, 'MinTemp': 0}
+    assert report.null_masks['Humidity9am'].tolist() == [False, True, True, False]
+    assert df['Pressure9am'].tolist()[0] == 1010.5
+
+def test_report_merge_and_valid_rows(raw_dataframe):
+    """Tests combining chunk reports and the row selectors they produce."""
+    _, first = validate_frame(raw_dataframe.iloc[:2].copy())
+    _, second = validate_frame(raw_dataframe.iloc[2:].copy())
+    report = ValidationReport().merge(first).merge(second)
+
+    assert report.rows == 4
+    assert report.null_counts['Humidity9am'] == 2
+    assert report.out_of_range['Humidity9am'] == 1
+    assert report.valid_rows('MinTemp') == slice(None)
+    assert report.valid_rows('Humidity9am').tolist() == [True, False, False, True]
+    assert report.valid_rows('Sunshine') is None
+
+def test_processor_reuses_report(raw_dataframe):
+    """Tests that stats computed from the report's null masks match dropna()."""
+    df, report = validate_frame(raw_dataframe)
+
+    assert list(WeatherProcessor(df, report=report).generate_stats()) == list(WeatherProcessor(df).generate_stats())
+    assert list(iter(WeatherProcessor(df, report=report))) == list(WeatherProcessor(df).generate_stats())
+
+def test_report_ignored_for_reordered_frame():
+    """Tests that a same-length frame the report was not built for falls back to dropna()."""
+    df, report = validate_frame(pd.DataFrame({
+        'MinTemp': [1., 2., np.nan, 4., 5.],
+        'Rainfall': [np.nan, 1., 2., 3., 4.],
+    }))
+    reversed_df = df.iloc[::-1].reset_index(drop=True)
+
+    assert report.covers(df)
+    assert not report.covers(reversed_df)
+    stats = {row['column']: row for row in WeatherProcessor(reversed_df, report=report).generate_stats()}
+    assert stats['Rainfall']['mean'] == 2.5
+    assert stats['Rainfall']['range'] == 3.0
+
+def test_column_added_after_validation_polars():
+    """Tests that a column without a null mask uses the engine's own null handling."""
+    pl = pytest.importorskip("polars")
+    df, report = validate_frame(pl.DataFrame({'MinTemp': [1.0, 2.0, 3.0]}))
+    df = df.with_columns(pl.Series('Derived', [1.0, float('nan'), 3.0]))
+    report.bind(df)
+
+    stats = {row['column']: row for row in WeatherProcessor(df, report=report).generate_stats()}
+    assert stats['Derived']['mean'] == 2.0
+
+def test_validate_frame_polars(raw_dataframe):
+    """Tests that the Polars engine produces the same report."""
+    pl = pytest.importorskip("polars")
+    polars_df = pl.DataFrame({
+        'Location': ['A', 'NA', 'B', None],
+        'Humidity9am': [50.0, 150.0, None, 70.0],
+        'Pressure9am': ['1010.5', '5', 'bad', '1020.5'],
+        'MinTemp': [10, 12, 14, 16],
+    })
+
+    _, expected = validate_frame(raw_dataframe.copy())
+    _, report = validate_frame(polars_df)
+
+    assert report.null_counts == expected.null_counts
+    assert report.out_of_range == expected.out_of_range
@@ -0,0 +1,128 @@
+import logging
+import weakref
+import numpy as np
+import pandas as pd
+from .engine import MISSING_TOKENS, get_engine
+
+logger = logging.getLogger(__name__)
+
+# Physically plausible (min, max) per column; None means unbounded
+VALID_RANGES = {
+    'MinTemp': (-60, 60),
+    'MaxTemp': (-60, 60),
+    'Temp9am': (-60, 60),
+    'Temp3pm': (-60, 60),
+    'Rainfall': (0, None),
+    'Evaporation': (0, None),
+    'Sunshine': (0, 24),
+    'WindGustSpeed': (0, None),
+    'WindSpeed9am': (0, None),
+    'WindSpeed3pm': (0, None),
+    'Humidity9am': (0, 100),
+    'Humidity3pm': (0, 100),
+    'Pressure9am': (850, 1100),
+    'Pressure3pm': (850, 1100),
+    'Cloud9am': (0, 9),
+    'Cloud3pm': (0, 9),
+}
+
+
+class ValidationReport:
+    """
+    Per-column null masks and counts produced by validate_frame().
+
+    Masks are positional (one bool per row of the validated frame), so
+    downstream steps can select valid rows without re-scanning for nulls.
+    The report is bound to that exact frame object; a reordered or modified
+    copy, even of the same length, is not covered.
+    """
+    def __init__(self, rows=0, null_masks=None, out_of_range=None):
+        self.rows = rows
+        self.null_masks = null_masks or {}
+        self.null_counts = {col: int(mask.sum()) for col, mask in self.null_masks.items()}
+        self.out_of_range = out_of_range or {}
+        self._frame = None
+
+    def bind(self, df):
+        """Record df as the frame these masks describe"""
+        self._frame = weakref.ref(df)
+        return self
+
+    def merge(self, other):
+        """Append the report of the next chunk"""
+        if not self.null_masks:
+            return other
+        null_masks = {
+            col: np.concatenate((self.null_masks.get(col, np.ones(self.rows, dtype=bool)),
+                                 other.null_masks.get(col, np.ones(other.rows, dtype=bool))))
+            for col in dict.fromkeys(list(self.null_masks) + list(other.null_masks))
+        }
+        out_of_range = dict(self.out_of_range)
+        for col, count in other.out_of_range.items():
+            out_of_range[col] = out_of_range.get(col, 0) + count
+        return ValidationReport(self.rows + other.rows, null_masks, out_of_range)
+
+    def covers(self, df):
+        """True if the report was bound to this exact frame"""
+        return self._frame is not None and self._frame() is df and self.rows == len(df)
+
+    def valid_rows(self, col):
+        """
+        Row selector for non-null values: a full slice when the column has no nulls,
+        or None when the report has no mask for the column (caller handles nulls itself)
+        """
+        if col not in self.null_masks:
+            return None
+        if self.null_counts[col] == 0:
+            return slice(None)
+        return ~self.null_masks[col]
+
+    def summary(self):
+        """Per-column null and out-of-range counts as a DataFrame"""
+        return pd.DataFrame({
+            'column': list(self.null_masks),
+            'nulls': [self.null_counts[col] for col in self.null_masks],
+            'out_of_range': [self.out_of_range.get(col, 0) for col in self.null_masks],
+        })
+
+
+def validate_frame(df, engine=None, valid_ranges=VALID_RANGES, missing_tokens=MISSING_TOKENS):
+    """
+    Normalize missing values and flag out-of-range readings in one vectorized pass.
+
+    - string columns: missing-value tokens become nulls
+    - columns in valid_ranges: coerced to numbers; readings outside the range
+      are counted in report.out_of_range and set to null
+    - every column: null mask and null count recorded in the report
+
+    Returns (df, report). Pandas frames are modified in place.
+    """
+    engine = get_engine(engine, df)
+
+    for col in engine.string_columns(df):
+        if col in valid_ranges:
+            continue
+        tokens = engine.isin_mask(df, col, missing_tokens)
+        if tokens.any():
+            df = engine.set_null(df, col, tokens)
+
+    out_of_range = {}
+    for col, (low, high) in valid_ranges.items():
+        if col not in df.columns:
+            continue
+        df = engine.to_numeric(df, col)
+        values = engine.column_array(df, col)
+        with np.errstate(invalid="ignore"):
+            bad = np.zeros(len(values), dtype=bool)
+            if low is not None:
+                bad |= values < low
+            if high is not None:
+                bad |= values > high
+        count = int(bad.sum())
+        if count:
+            logger.warning(f"Column '{col}' has {count} out-of-range readings (valid range {low} to {high})")
+            df = engine.set_null(df, col, bad)
+            out_of_range[col] = count
+
+    null_masks = {col: engine.null_mask(df, col) for col in df.columns}
+    return df, ValidationReport(len(df), null_masks, out_of_range).bind(df)
@@ -1,14 +1,30 @@
 import logging
+from pathlib import Path
+from weather_stats.engine import get_engine
 
 logger = logging.getLogger(__name__)
 
 class WeatherStorage:
-    def __init__(self, out_file="descriptive_stats.csv"):
+    def __init__(self, out_file="descriptive_stats.csv", engine=None):
         self.out_file = out_file
+        self.engine = engine
 
-    def save_stats(self, df):
+    def save_stats(self, df, report=None):
         try:
-            df.to_csv(self.out_file, index=False)
+            # Engine is inferred from the frame unless one was given explicitly
+            get_engine(self.engine, df).write_csv(df, self.out_file)
             logger.info(f"Successfully saved statistics to {self.out_file}")
+            if report is not None:
+                self.save_validation(report)
         except Exception:
             raise
+
+    def validation_file(self):
+        """Path of the validation summary written next to out_file"""
+        out_file = Path(self.out_file)
+        return out_file.with_name(f"{out_file.stem}_validation.csv")
+
+    def save_validation(self, report):
+        """Save per-column null and out-of-range counts from a ValidationReport"""
+        report.summary().to_csv(self.validation_file(), index=False)
+        logger.info(f"Successfully saved validation summary to {self.validation_file()}")
@@ -16,11 +16,22 @@ logger = logging.getLogger(__name__)
 basedir = os.path.abspath(os.path.dirname(__file__))
 app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{os.path.join(basedir, "weather.db")}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Read backend: 'sqlite' (query the database per request) or 'memory' (columnar replica)
+app.config['WEATHER_BACKEND'] = os.environ.get('WEATHER_BACKEND', 'sqlite')
+# How often the replica checks whether another process (load_data.py) loaded new data
+app.config['REPLICA_REFRESH_SECONDS'] = float(os.environ.get('REPLICA_REFRESH_SECONDS', 5))
 
 # Import models and initialize SQLAlchemy with app
-from models import db, WeatherData
+from models import db, WeatherData, WeatherDistribution, WEATHER_FIELDS
 from sqlalchemy import func
+from replica import replica, STAT_AGGREGATES
+import encoding
 db.init_app(app)
+replica.init_app(app)
+
+def round_stat(value):
+    """Round an aggregate for the /api/stats response"""
+    return round(value, 2) if value else None
 
 # Routes
 @app.route('/')
@@ -42,8 +53,17 @@ def get_weather_data():
     - rain_today: Filter by rain today (Yes/No)
     - limit: Number of records to return (default: 100, max: 1000)
     - offset: Number of records to skip (for pagination)
+    - format: json (default), columnar, msgpack or arrow; also negotiable via the Accept header
+    
+    Responses are gzip/brotli compressed when the client sends Accept-Encoding.
     """
     try:
+        # Negotiate (and validate) the format before doing any work
+        fmt = encoding.negotiate_format(request)
+        
+        if replica.enabled:
+            return get_weather_data_from_replica(fmt)
+
         # Start with base query
         query = db.session.query(WeatherData)
         
@@ -87,14 +107,20 @@ def get_weather_data():
         # Convert to dictionary
         data = [record.to_dict() for record in results]
         
-        return jsonify({
+        return encoding.make_response({
             'success': True,
             'count': len(data),
             'total': total_count,
             'limit': limit,
             'offset': offset,
             'data': data
-        })
+        }, WEATHER_FIELDS, fmt, request)
+    
+    except encoding.UnsupportedFormat as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 406
     
     except Exception as e:
         logger.error(f"Error fetching weather data: {e}", exc_info=True)
@@ -103,6 +129,32 @@ def get_weather_data():
             'error': str(e)
         }), 500
 
+def get_weather_data_from_replica(fmt):
+    """Answer /api/weather from the in-memory replica using index lookups and vectorized masks"""
+    snapshot = replica.snapshot
+
+    rows = snapshot.query(
+        location=request.args.get('location') or None,
+        ranges={
+            'min_temp': (request.args.get('min_temp_min', type=float), request.args.get('min_temp_max', type=float)),
+            'max_temp': (request.args.get('max_temp_min', type=float), request.args.get('max_temp_max', type=float)),
+        },
+        rain_today=request.args.get('rain_today')
+    )
+
+    limit = min(request.args.get('limit', 100, type=int), 1000)
+    offset = request.args.get('offset', 0, type=int)
+    data = snapshot.records(rows[offset:offset + limit])
+
+    return encoding.make_response({
+        'success': True,
+        'count': len(data),
+        'total': len(rows),
+        'limit': limit,
+        'offset': offset,
+        'data': data
+    }, snapshot.fields, fmt, request)
+
 @app.route('/api/stats', methods=['GET'])
 def get_statistics():
     """
@@ -112,6 +164,20 @@ def get_statistics():
     - location: Filter statistics by location
     """
     try:
+        location = request.args.get('location')
+
+        if replica.enabled:
+            snapshot = replica.snapshot
+            result = snapshot.stats.get(location or None, {'total_records': 0, **dict.fromkeys(STAT_AGGREGATES)})
+            return jsonify({
+                'success': True,
+                'location': location if location else 'All locations',
+                'statistics': {
+                    'total_records': result['total_records'],
+                    **{name: round_stat(result[name]) for name in STAT_AGGREGATES}
+                }
+            })
+
         # Base query
         query = db.session.query(
             func.count(WeatherData.id).label('total_records'),
@@ -127,7 +193,6 @@ def get_statistics():
         )
         
         # Filter by location if provided
-        location = request.args.get('location')
         if location:
             query = query.filter(WeatherData.location == location)
         
@@ -138,15 +203,15 @@ def get_statistics():
             'location': location if location else 'All locations',
             'statistics': {
                 'total_records': result.total_records,
-                'avg_min_temp': round(result.avg_min_temp, 2) if result.avg_min_temp else None,
-                'avg_max_temp': round(result.avg_max_temp, 2) if result.avg_max_temp else None,
-                'lowest_temp': round(result.lowest_temp, 2) if result.lowest_temp else None,
-                'highest_temp': round(result.highest_temp, 2) if result.highest_temp else None,
-                'avg_rainfall': round(result.avg_rainfall, 2) if result.avg_rainfall else None,
-                'avg_humidity_9am': round(result.avg_humidity_9am, 2) if result.avg_humidity_9am else None,
-                'avg_humidity_3pm': round(result.avg_humidity_3pm, 2) if result.avg_humidity_3pm else None,
-                'avg_pressure_9am': round(result.avg_pressure_9am, 2) if result.avg_pressure_9am else None,
-                'avg_pressure_3pm': round(result.avg_pressure_3pm, 2) if result.avg_pressure_3pm else None
+                'avg_min_temp': round_stat(result.avg_min_temp),
+                'avg_max_temp': round_stat(result.avg_max_temp),
+                'lowest_temp': round_stat(result.lowest_temp),
+                'highest_temp': round_stat(result.highest_temp),
+                'avg_rainfall': round_stat(result.avg_rainfall),
+                'avg_humidity_9am': round_stat(result.avg_humidity_9am),
+                'avg_humidity_3pm': round_stat(result.avg_humidity_3pm),
+                'avg_pressure_9am': round_stat(result.avg_pressure_9am),
+                'avg_pressure_3pm': round_stat(result.avg_pressure_3pm)
             }
         }
         
@@ -159,10 +224,98 @@ def get_statistics():
             'error': str(e)
         }), 500
 
+def select_percentiles(percentiles, requested):
+    """
+    Pick the requested entries from a stored percentile list, in request order
+    
+    Args:
+        percentiles: Stored list of {'percentile': p, 'value': v}
+        requested: Comma-separated percentiles, e.g. "5,50,95" or "5.0"
+    
+    Raises:
+        ValueError: if a value is not a number or was not precomputed
+    """
+    available = {entry['percentile']: entry for entry in percentiles}
+    selected = []
+    for p in requested.split(','):
+        if not p.strip():
+            continue
+        try:
+            selected.append(available[float(p)])
+        except (ValueError, KeyError):
+            raise ValueError(
+                f"Percentile '{p.strip()}' not precomputed. "
+                f"Available: {', '.join(f'{a:g}' for a in available)}"
+            ) from None
+    return selected
+
+@app.route('/api/distribution', methods=['GET'])
+def get_distribution():
+    """
+    API endpoint to fetch the histogram and percentiles of a numeric column
+    
+    Served from summaries precomputed by load_data.py, so the cost does not
+    depend on the number of rows.
+    
+    Query Parameters:
+    - column: Numeric WeatherData column, e.g. min_temp or rainfall (required)
+    - location: Distribution for one location (default: all locations)
+    - percentiles: Comma-separated subset to return, e.g. 5,50,95 (default: all)
+    """
+    try:
+        column = request.args.get('column')
+        numeric_columns = [c.name for c in WeatherData.__table__.columns if isinstance(c.type, db.Float)]
+        if column not in numeric_columns:
+            return jsonify({
+                'success': False,
+                'error': f"column must be one of: {', '.join(numeric_columns)}"
+            }), 400
+        
+        location = request.args.get('location') or None
+        distribution = db.session.query(WeatherDistribution)\
+            .filter(WeatherDistribution.column == column)\
+            .filter(WeatherDistribution.location.is_(None) if location is None else WeatherDistribution.location == location)\
+            .first()
+        if distribution is None:
+            return jsonify({
+                'success': False,
+                'error': f"No distribution for column '{column}' and location '{location or 'All locations'}'"
+            }), 404
+        
+        data = distribution.to_dict()
+        data['location'] = location if location else 'All locations'
+        
+        requested = request.args.get('percentiles')
+        if requested:
+            try:
+                data['percentiles'] = select_percentiles(data['percentiles'], requested)
+            except ValueError as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 400
+        
+        return jsonify({'success': True, **data})
+    
+    except Exception as e:
+        logger.error(f"Error fetching distribution: {e}", exc_info=True)
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/locations', methods=['GET'])
 def get_locations():
     """Get list of unique locations in the database"""
     try:
+        if replica.enabled:
+            location_list = replica.snapshot.locations
+            return jsonify({
+                'success': True,
+                'count': len(location_list),
+                'locations': location_list
+            })
+
         locations = db.session.query(WeatherData.location)\
             .distinct()\
             .order_by(WeatherData.location)\
@@ -204,6 +357,10 @@ if __name__ == '__main__':
                 logger.info("You can manually load data by running: python load_data.py")
         else:
             logger.info(f"Database contains {row_count} weather records")
+        
+        # Warm the in-memory replica before serving requests
+        if replica.enabled:
+            logger.info(f"Replica loaded with {replica.snapshot.size} rows")
     
     # Run the Flask app
     app.run(debug=True, host='0.0.0.0', port=5001)
\ No newline at end of file
@@ -0,0 +1,134 @@
+"""
+Content negotiation for /api/weather responses.
+
+Layouts/formats (chosen by the `format` query parameter, else the Accept header):
+- json:     one object per row (original layout)
+- columnar: JSON with one array per field instead of one object per row
+- msgpack:  columnar layout encoded as MessagePack (requires msgpack)
+- arrow:    Arrow IPC stream, one column per field (requires pyarrow)
+
+Any of them is compressed with brotli or gzip when the client's
+Accept-Encoding allows it.
+"""
+import gzip
+import json
+import logging
+from flask import Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional
+    brotli = None
+try:
+    import msgpack
+except ImportError:  # msgpack is optional
+    msgpack = None
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+MIMETYPES = {
+    'json': 'application/json',
+    'columnar': 'application/vnd.weather.columnar+json',
+    'msgpack': 'application/msgpack',
+    'arrow': 'application/vnd.apache.arrow.stream',
+}
+
+# Responses smaller than this are not worth compressing
+MIN_COMPRESS_SIZE = 1024
+
+
+class UnsupportedFormat(Exception):
+    """Requested format is unknown or its optional dependency is not installed"""
+
+
+def available_formats():
+    formats = ['json', 'columnar']
+    if msgpack is not None:
+        formats.append('msgpack')
+    if pa is not None:
+        formats.append('arrow')
+    return formats
+
+
+def negotiate_format(request):
+    """Pick the response format from ?format=... or the Accept header"""
+    formats = available_formats()
+    requested = request.args.get('format')
+    if requested:
+        if requested not in formats:
+            raise UnsupportedFormat(f"Unsupported format '{requested}'. Available: {', '.join(formats)}")
+        return requested
+
+    best = request.accept_mimetypes.best_match([MIMETYPES[fmt] for fmt in formats])
+    for fmt in formats:
+        if MIMETYPES[fmt] == best:
+            return fmt
+    return 'json'
+
+
+def negotiate_encoding(request):
+    """Pick a content encoding from the Accept-Encoding header, or None"""
+    offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+    return request.accept_encodings.best_match(offered)
+
+
+def to_columnar(payload, fields):
+    """Replace payload['data'] (list of row dicts) with payload['columns'] (dict of lists)"""
+    rows = payload['data']
+    columnar = {key: value for key, value in payload.items() if key != 'data'}
+    columnar['fields'] = fields
+    columnar['columns'] = {field: [row[field] for row in rows] for field in fields}
+    return columnar
+
+
+def _to_arrow(payload, fields):
+    """Arrow IPC stream; the paging metadata travels in the schema metadata"""
+    columnar = to_columnar(payload, fields)
+    table = pa.table(columnar.pop('columns'))
+    columnar.pop('fields')
+    table = table.replace_schema_metadata({key: json.dumps(value) for key, value in columnar.items()})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def encode(payload, fields, fmt):
+    """Serialize a /api/weather payload to bytes in the given format"""
+    # allow_nan=False: NaN/Infinity are not valid JSON, so fail loudly instead of emitting them
+    if fmt == 'json':
+        return json.dumps(payload, separators=(',', ':'), allow_nan=False).encode('utf-8')
+    if fmt == 'columnar':
+        return json.dumps(to_columnar(payload, fields), separators=(',', ':'), allow_nan=False).encode('utf-8')
+    if fmt == 'msgpack':
+        return msgpack.packb(to_columnar(payload, fields))
+    if fmt == 'arrow':
+        return _to_arrow(payload, fields)
+    raise UnsupportedFormat(f"Unsupported format '{fmt}'")
+
+
+def compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=6)
+    return body
+
+
+def make_response(payload, fields, fmt, request):
+    """Build a (possibly compressed) response in fmt, as returned by negotiate_format()"""
+    body = encode(payload, fields, fmt)
+
+    encoding = negotiate_encoding(request) if len(body) >= MIN_COMPRESS_SIZE else None
+    body = compress(body, encoding)
+
+    response = Response(body, mimetype=MIMETYPES[fmt])
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept, Accept-Encoding'
+    logger.debug(f"Encoded /api/weather response as {fmt} ({encoding or 'identity'}, {len(body)} bytes)")
+    return response
@@ -66,5 +66,53 @@ class WeatherData(db.Model):
         return f'<WeatherData {self.date} - {self.location}>'
 
 
+# Fields returned by the API for each WeatherData row (to_dict() keys, in order)
+WEATHER_FIELDS = [column.name for column in WeatherData.__table__.columns if column.name != 'created_at']
+
+
+class WeatherDistribution(db.Model):
+    """Histogram and percentile summary of one numeric WeatherData column, computed at ingestion"""
+    __tablename__ = 'weather_distribution'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    column = db.Column(db.String(50), nullable=False)
+    location = db.Column(db.String(100))  # NULL means all locations
+    count = db.Column(db.Integer)
+    bin_edges = db.Column(db.JSON)
+    bin_counts = db.Column(db.JSON)
+    percentiles = db.Column(db.JSON)  # ordered list, e.g. [{"percentile": 5, "value": 3.1}, ...]
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (db.UniqueConstraint('column', 'location'),)
+    
+    def to_dict(self):
+        """Convert model to dictionary"""
+        return {
+            'column': self.column,
+            'location': self.location,
+            'count': self.count,
+            'histogram': {
+                'bin_edges': self.bin_edges,
+                'counts': self.bin_counts
+            },
+            'percentiles': self.percentiles
+        }
+    
+    def __repr__(self):
+        return f'<WeatherDistribution {self.column} - {self.location or "All locations"}>'
+
+
+class DataLoad(db.Model):
+    """One row per completed load_data run; its id acts as the data version"""
+    __tablename__ = 'data_load'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    row_count = db.Column(db.Integer)
+    loaded_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<DataLoad {self.id} - {self.row_count} rows>'
+
+
 # Note: db is initialized here but will be configured with app in app.py
 # This avoids circular imports
\ No newline at end of file
@@ -0,0 +1,210 @@
+"""
+In-memory columnar read replica of the weather_data table.
+
+The whole table is loaded into NumPy columns once, ordered by (location, id),
+so every location is a contiguous row range. Range filters use per-location
+sorted-value indexes and /api/stats aggregates are precomputed per location.
+Results are returned in id order, like the SQLite backend.
+
+A new snapshot is built off to the side and swapped in with a single
+reference assignment, so requests never see a half-built replica. Loads
+in this process publish directly; loads from another process (e.g.
+`python load_data.py`) are picked up by polling the data_load table.
+"""
+import logging
+import threading
+import time
+import numpy as np
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.exc import OperationalError
+
+from models import db, WeatherData, DataLoad, WEATHER_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Columns with sorted-value indexes (the range filters on /api/weather)
+INDEXED_COLUMNS = ['min_temp', 'max_temp']
+
+# Aggregates served by /api/stats: name -> (reducer, column)
+STAT_AGGREGATES = {
+    'avg_min_temp': (np.nanmean, 'min_temp'),
+    'avg_max_temp': (np.nanmean, 'max_temp'),
+    'lowest_temp': (np.nanmin, 'min_temp'),
+    'highest_temp': (np.nanmax, 'max_temp'),
+    'avg_rainfall': (np.nanmean, 'rainfall'),
+    'avg_humidity_9am': (np.nanmean, 'humidity_9am'),
+    'avg_humidity_3pm': (np.nanmean, 'humidity_3pm'),
+    'avg_pressure_9am': (np.nanmean, 'pressure_9am'),
+    'avg_pressure_3pm': (np.nanmean, 'pressure_3pm'),
+}
+
+
+def _aggregate(reducer, values):
+    """Apply a NaN-aware reducer, returning None like SQL does for all-NULL input"""
+    if values.size == 0 or np.isnan(values).all():
+        return None
+    return float(reducer(values))
+
+
+class WeatherSnapshot:
+    """Immutable columnar copy of weather_data"""
+
+    def __init__(self, df, version=None):
+        df = df.sort_values(['location', 'id'], na_position='last', kind='stable').reset_index(drop=True)
+        self.size = len(df)
+        self.fields = WEATHER_FIELDS
+        self.version = version
+
+        self.columns = {}
+        for name in self.fields:
+            column = WeatherData.__table__.columns[name]
+            if isinstance(column.type, db.Float):
+                self.columns[name] = df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+            else:
+                values = df[name].to_numpy(dtype=object, copy=True)
+                values[pd.isna(values)] = None
+                self.columns[name] = values
+
+        # Per-location row ranges; None is the whole table
+        locations = self.columns['location']
+        self.ranges = {None: (0, self.size)}
+        if self.size:
+            boundaries = np.flatnonzero(locations[1:] != locations[:-1]) + 1
+            starts = np.concatenate(([0], boundaries))
+            stops = np.concatenate((boundaries, [self.size]))
+            for start, stop in zip(starts, stops):
+                if locations[start] is not None:
+                    self.ranges[locations[start]] = (int(start), int(stop))
+        self.locations = sorted(key for key in self.ranges if key is not None)
+
+        # Positions in id order, for unfiltered-by-location results (ranges are already in id order)
+        self.id_order = np.argsort(df['id'].to_numpy(), kind='stable')
+
+        # Sorted-value indexes: positions (relative to the range start) ordered by value, NaN last
+        self.indexes = {}
+        for name in INDEXED_COLUMNS:
+            values = self.columns[name]
+            for key, (start, stop) in self.ranges.items():
+                order = np.argsort(values[start:stop], kind='stable')
+                sorted_values = values[start:stop][order]
+                valid = int(np.count_nonzero(~np.isnan(sorted_values)))
+                self.indexes[(name, key)] = (order, sorted_values, valid)
+
+        # Precomputed /api/stats aggregates per location
+        self.stats = {}
+        for key, (start, stop) in self.ranges.items():
+            stats = {'total_records': stop - start}
+            for stat, (reducer, name) in STAT_AGGREGATES.items():
+                stats[stat] = _aggregate(reducer, self.columns[name][start:stop])
+            self.stats[key] = stats
+
+    def _range_mask(self, name, location, low, high):
+        """Boolean mask over a location's rows for low <= value <= high, via the sorted index"""
+        start, stop = self.ranges[location]
+        order, sorted_values, valid = self.indexes[(name, location)]
+        left = np.searchsorted(sorted_values[:valid], low, side='left') if low is not None else 0
+        right = np.searchsorted(sorted_values[:valid], high, side='right') if high is not None else valid
+        mask = np.zeros(stop - start, dtype=bool)
+        mask[order[left:right]] = True
+        return mask
+
+    def query(self, location=None, ranges=None, rain_today=None):
+        """
+        Return the row positions matching the /api/weather filters, in id order.
+
+        ranges maps an indexed column to a (low, high) pair; either bound may be None.
+        """
+        if location is not None and location not in self.ranges:
+            return np.empty(0, dtype=np.intp)
+        start, stop = self.ranges[location]
+
+        mask = np.ones(stop - start, dtype=bool)
+        for name, (low, high) in (ranges or {}).items():
+            if low is not None or high is not None:
+                mask &= self._range_mask(name, location, low, high)
+        if rain_today:
+            mask &= self.columns['rain_today'][start:stop] == rain_today
+        if location is None:
+            return self.id_order[mask[self.id_order]]
+        return np.flatnonzero(mask) + start
+
+    def records(self, rows):
+        """Materialize rows as dictionaries in the same shape as WeatherData.to_dict()"""
+        columns = {}
+        for name in self.fields:
+            values = self.columns[name][rows]
+            if values.dtype == np.float64:
+                values = np.where(np.isnan(values), None, values)
+            columns[name] = values.tolist()
+        return [dict(zip(self.fields, row)) for row in zip(*(columns[name] for name in self.fields))]
+
+
+def data_version():
+    """Id of the latest data_load row (None if nothing has been recorded)"""
+    try:
+        return db.session.query(func.max(DataLoad.id)).scalar()
+    except OperationalError:
+        # Database created before the data_load table existed
+        db.session.rollback()
+        return None
+
+
+class WeatherReplica:
+    """Holds the current snapshot and swaps in new ones when data is published"""
+
+    def __init__(self):
+        self.enabled = False
+        self.refresh_seconds = 5
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config.get('WEATHER_BACKEND') == 'memory'
+        self.refresh_seconds = app.config.get('REPLICA_REFRESH_SECONDS', 5)
+        if self.enabled:
+            logger.info("Serving API reads from the in-memory replica")
+
+    @property
+    def snapshot(self):
+        """Current snapshot, loaded on first use and rebuilt when another process loads new data"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = self._build()
+                    self._checked_at = time.monotonic()
+                return self._snapshot
+
+        if time.monotonic() - self._checked_at >= self.refresh_seconds:
+            # Only one request checks/rebuilds; the others keep serving the current snapshot
+            if self._lock.acquire(blocking=False):
+                try:
+                    self._checked_at = time.monotonic()
+                    if data_version() != self._snapshot.version:
+                        self._snapshot = self._build()
+                        logger.info(f"Reloaded replica snapshot with {self._snapshot.size} rows")
+                finally:
+                    self._lock.release()
+            snapshot = self._snapshot
+        return snapshot
+
+    def publish(self):
+        """Rebuild from the database and atomically replace the current snapshot"""
+        if not self.enabled:
+            return
+        snapshot = self._build()
+        with self._lock:
+            self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+        logger.info(f"Published new replica snapshot with {snapshot.size} rows")
+
+    def _build(self):
+        # Read the version first so a load that lands mid-build triggers another rebuild
+        version = data_version()
+        df = pd.read_sql_table(WeatherData.__tablename__, db.engine)
+        return WeatherSnapshot(df, version=version)
+
+
+replica = WeatherReplica()
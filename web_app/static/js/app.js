@@ -85,13 +85,16 @@ async function loadWeatherData() {
 
     try {
         // Build query string
+        // Ask for the columnar layout (one array per field); the browser
+        // negotiates gzip/brotli via Accept-Encoding automatically
         const params = new URLSearchParams({
             ...currentFilters,
             offset: currentOffset,
+            format: "columnar",
         });
 
         const response = await fetch(`${API_BASE}/weather?${params}`);
-        const data = await response.json();
+        const data = decodeColumnar(await response.json());
 
         loading.style.display = "none";
 
@@ -110,6 +113,24 @@ async function loadWeatherData() {
     }
 }
 
+// Convert a columnar response ({fields, columns}) back to one object per row
+function decodeColumnar(data) {
+    if (!data.columns) {
+        return data;
+    }
+
+    const { fields, columns, ...rest } = data;
+    const rows = new Array(data.count);
+    for (let i = 0; i < data.count; i++) {
+        const record = {};
+        for (const field of fields) {
+            record[field] = columns[field][i];
+        }
+        rows[i] = record;
+    }
+    return { ...rest, data: rows };
+}
+
 // Display results in table
 function displayResults(data) {
     const resultsTable = document.getElementById("results-table");
@@ -0,0 +1,24 @@
+import pytest
+from app import app, select_percentiles
+
+PERCENTILES = [
+    {'percentile': 5.0, 'value': 1.0},
+    {'percentile': 10.0, 'value': 2.0},
+    {'percentile': 50.0, 'value': 3.0},
+    {'percentile': 95.0, 'value': 4.0},
+]
+
+def test_select_percentiles_keeps_request_order():
+    selected = select_percentiles(PERCENTILES, '95,5.0, 50')
+    assert [p['percentile'] for p in selected] == [95.0, 5.0, 50.0]
+
+def test_select_percentiles_rejects_unknown():
+    with pytest.raises(ValueError):
+        select_percentiles(PERCENTILES, '3')
+    with pytest.raises(ValueError):
+        select_percentiles(PERCENTILES, 'median')
+
+def test_weather_unsupported_format_returns_406():
+    response = app.test_client().get('/api/weather?format=xml')
+    assert response.status_code == 406
+    assert response.get_json()['success'] is False
@@ -0,0 +1,84 @@
+import gzip
+import json
+import math
+import pytest
+from flask import Flask, request
+import encoding
+
+FIELDS = ['id', 'location', 'min_temp']
+PAYLOAD = {
+    'success': True,
+    'count': 2,
+    'total': 2,
+    'limit': 100,
+    'offset': 0,
+    'data': [
+        {'id': 1, 'location': 'Albury', 'min_temp': 5.5},
+        {'id': 2, 'location': 'Cairns', 'min_temp': None},
+    ],
+}
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+def test_to_columnar():
+    columnar = encoding.to_columnar(PAYLOAD, FIELDS)
+    assert 'data' not in columnar
+    assert columnar['total'] == 2
+    assert columnar['fields'] == FIELDS
+    assert columnar['columns'] == {'id': [1, 2], 'location': ['Albury', 'Cairns'], 'min_temp': [5.5, None]}
+
+
+def test_encode_json_layouts():
+    assert json.loads(encoding.encode(PAYLOAD, FIELDS, 'json')) == PAYLOAD
+    columnar = json.loads(encoding.encode(PAYLOAD, FIELDS, 'columnar'))
+    assert columnar['columns']['min_temp'] == [5.5, None]
+
+
+def test_encode_rejects_nan():
+    payload = dict(PAYLOAD, data=[{'id': 1, 'location': 'Albury', 'min_temp': math.nan}])
+    with pytest.raises(ValueError):
+        encoding.encode(payload, FIELDS, 'json')
+
+
+def test_encode_msgpack():
+    msgpack = pytest.importorskip('msgpack')
+    decoded = msgpack.unpackb(encoding.encode(PAYLOAD, FIELDS, 'msgpack'))
+    assert decoded['columns']['location'] == ['Albury', 'Cairns']
+
+
+def test_encode_arrow():
+    pa = pytest.importorskip('pyarrow')
+    table = pa.ipc.open_stream(encoding.encode(PAYLOAD, FIELDS, 'arrow')).read_all()
+    assert table.to_pylist() == PAYLOAD['data']
+    assert table.schema.metadata[b'total'] == b'2'
+
+
+def test_negotiate_format(app):
+    with app.test_request_context('/?format=columnar'):
+        assert encoding.negotiate_format(request) == 'columnar'
+    with app.test_request_context('/', headers={'Accept': 'text/html,*/*;q=0.8'}):
+        assert encoding.negotiate_format(request) == 'json'
+    with app.test_request_context('/?format=xml'):
+        with pytest.raises(encoding.UnsupportedFormat):
+            encoding.negotiate_format(request)
+
+
+def test_gzip_response(app, monkeypatch):
+    monkeypatch.setattr(encoding, 'brotli', None)
+    monkeypatch.setattr(encoding, 'MIN_COMPRESS_SIZE', 0)
+    with app.test_request_context('/', headers={'Accept-Encoding': 'gzip, br'}):
+        response = encoding.make_response(PAYLOAD, FIELDS, 'json', request)
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.mimetype == 'application/json'
+    assert json.loads(gzip.decompress(response.get_data())) == PAYLOAD
+
+
+def test_small_response_is_not_compressed(app):
+    with app.test_request_context('/', headers={'Accept-Encoding': 'gzip'}):
+        response = encoding.make_response(PAYLOAD, FIELDS, 'columnar', request)
+    assert 'Content-Encoding' not in response.headers
+    assert json.loads(response.get_data())['fields'] == FIELDS
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+from utils.load_data import validate_weather_frame
+
+
+@pytest.fixture
+def weather_frame():
+    """Creates a small frame with database column names."""
+    return pd.DataFrame({
+        'location': ['A', 'A', 'B', None],
+        'humidity_9am': [50.0, 150.0, np.nan, 70.0],
+        'pressure_9am': ['1010.5', '5', 'bad', '1020.5'],
+    })
+
+def test_validate_weather_frame(weather_frame):
+    """Tests range checks, numeric coercion and null masks."""
+    df, null_masks, out_of_range = validate_weather_frame(weather_frame)
+
+    assert out_of_range == {'humidity_9am': 1, 'pressure_9am': 1}
+    assert null_masks['humidity_9am'].tolist() == [False, True, True, False]
+    assert null_masks['pressure_9am'].tolist() == [False, True, True, False]
+    assert null_masks['location'].tolist() == [False, False, False, True]
+    assert df['pressure_9am'].tolist()[0] == 1010.5
+
+def test_compute_distributions():
+    """Tests shared bin edges, per-location counts and skipped all-NaN columns."""
+    from utils.load_data import compute_distributions
+    df = pd.DataFrame({
+        'location': ['A', 'A', 'B', 'B', None],
+        'min_temp': [1.0, 2.0, 3.0, np.nan, 5.0],
+        'rainfall': [np.nan] * 5,
+    })
+    distributions = compute_distributions(df, bins=4, percentiles=[5, 50, 95])
+    by_location = {d.location: d for d in distributions if d.column == 'min_temp'}
+
+    assert not [d for d in distributions if d.column == 'rainfall']
+    assert set(by_location) == {None, 'A', 'B'}
+    assert by_location[None].count == 4
+    assert by_location['A'].bin_edges == by_location['B'].bin_edges == by_location[None].bin_edges
+    assert len(by_location[None].bin_counts) == 4
+    # Per-location counts add up to the overall counts minus the row without a location
+    summed = np.add(by_location['A'].bin_counts, by_location['B'].bin_counts)
+    assert (np.array(by_location[None].bin_counts) - summed).tolist() == [0, 0, 0, 1]
+    assert [p['percentile'] for p in by_location[None].percentiles] == [5, 50, 95]
+    assert by_location['A'].percentiles[1]['value'] == 1.5
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+from flask import Flask
+from models import db, WeatherData, DataLoad, WEATHER_FIELDS
+from replica import WeatherSnapshot, WeatherReplica
+
+
+def make_frame(rows):
+    """Build a weather_data-shaped frame; unspecified fields are NULL."""
+    return pd.DataFrame([{field: row.get(field) for field in WEATHER_FIELDS} for row in rows])
+
+
+@pytest.fixture
+def snapshot():
+    return WeatherSnapshot(make_frame([
+        {'id': 1, 'location': 'Cairns', 'min_temp': 20.0, 'max_temp': 30.0, 'rain_today': 'No'},
+        {'id': 2, 'location': 'Albury', 'min_temp': 5.0, 'max_temp': 15.0, 'rain_today': 'Yes'},
+        {'id': 3, 'location': 'Albury', 'min_temp': None, 'max_temp': 18.0, 'rain_today': 'No'},
+        {'id': 4, 'location': 'Albury', 'min_temp': 10.0, 'max_temp': None, 'rain_today': 'Yes'},
+        {'id': 5, 'location': None, 'min_temp': 12.0, 'max_temp': 22.0},
+    ]))
+
+
+def ids(snapshot, rows):
+    return [record['id'] for record in snapshot.records(rows)]
+
+
+def test_unfiltered_query_is_in_id_order(snapshot):
+    assert ids(snapshot, snapshot.query()) == [1, 2, 3, 4, 5]
+
+
+def test_location_ranges(snapshot):
+    assert snapshot.locations == ['Albury', 'Cairns']
+    assert ids(snapshot, snapshot.query(location='Albury')) == [2, 3, 4]
+    assert len(snapshot.query(location='Nowhere')) == 0
+
+
+def test_range_bounds_are_inclusive_and_skip_nulls(snapshot):
+    rows = snapshot.query(ranges={'min_temp': (5.0, 12.0)})
+    assert ids(snapshot, rows) == [2, 4, 5]
+
+    rows = snapshot.query(location='Albury', ranges={'min_temp': (None, 10.0), 'max_temp': (None, None)})
+    assert ids(snapshot, rows) == [2, 4]
+
+    rows = snapshot.query(location='Albury', ranges={'max_temp': (15.0, None)})
+    assert ids(snapshot, rows) == [2, 3]
+
+
+def test_rain_today_filter(snapshot):
+    assert ids(snapshot, snapshot.query(rain_today='Yes')) == [2, 4]
+
+
+def test_stats_match_sql_semantics(snapshot):
+    albury = snapshot.stats['Albury']
+    assert albury['total_records'] == 3
+    assert albury['avg_min_temp'] == 7.5
+    assert albury['lowest_temp'] == 5.0
+    assert albury['highest_temp'] == 18.0
+    assert albury['avg_rainfall'] is None  # all NULL
+    assert snapshot.stats[None]['total_records'] == 5
+
+
+def test_records_convert_nan_to_none(snapshot):
+    record = snapshot.records(snapshot.query(location='Albury'))[1]
+    assert record['id'] == 3
+    assert record['min_temp'] is None
+    assert record['rainfall'] is None
+    assert list(record) == WEATHER_FIELDS
+
+
+def test_replica_reloads_after_load_in_another_process(tmp_path):
+    """A new data_load row (as written by load_data.py) triggers a rebuild."""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'weather.db'}"
+    app.config['WEATHER_BACKEND'] = 'memory'
+    app.config['REPLICA_REFRESH_SECONDS'] = 0
+    db.init_app(app)
+    replica = WeatherReplica()
+    replica.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(WeatherData(location='Albury', min_temp=1.0))
+        db.session.add(DataLoad(row_count=1))
+        db.session.commit()
+        assert replica.snapshot.size == 1
+
+        db.session.add(WeatherData(location='Cairns', min_temp=2.0))
+        db.session.commit()
+        assert replica.snapshot.size == 1  # no new data_load row yet
+
+        db.session.add(DataLoad(row_count=2))
+        db.session.commit()
+        assert replica.snapshot.size == 2
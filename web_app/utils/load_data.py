@@ -1,15 +1,127 @@
 """
 Script to load CSV weather data into the SQLite database
 """
+import numpy as np
 import pandas as pd
 from app import app, db
-from models import WeatherData
+from models import WeatherData, WeatherDistribution, DataLoad
+from replica import replica
 import logging
 import os
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Physically plausible (min, max) per database column; None means unbounded.
+# Mirrors weather_stats.validation.VALID_RANGES, which the web app does not depend on.
+VALID_RANGES = {
+    'min_temp': (-60, 60),
+    'max_temp': (-60, 60),
+    'temp_9am': (-60, 60),
+    'temp_3pm': (-60, 60),
+    'rainfall': (0, None),
+    'evaporation': (0, None),
+    'sunshine': (0, 24),
+    'wind_gust_speed': (0, None),
+    'wind_speed_9am': (0, None),
+    'wind_speed_3pm': (0, None),
+    'humidity_9am': (0, 100),
+    'humidity_3pm': (0, 100),
+    'pressure_9am': (850, 1100),
+    'pressure_3pm': (850, 1100),
+    'cloud_9am': (0, 9),
+    'cloud_3pm': (0, 9),
+}
+
+def validate_weather_frame(df):
+    """
+    Coerce numeric columns, null out impossible readings and compute null masks
+    in one vectorized pass
+    
+    Args:
+        df: DataFrame with database column names (modified in place)
+    
+    Returns:
+        (df, null_masks, out_of_range) where null_masks maps every column to a
+        boolean array and out_of_range maps columns to the number of nulled values
+    """
+    out_of_range = {}
+    for col, (low, high) in VALID_RANGES.items():
+        if col not in df.columns:
+            continue
+        values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, copy=True)
+        with np.errstate(invalid='ignore'):
+            bad = np.zeros(len(values), dtype=bool)
+            if low is not None:
+                bad |= values < low
+            if high is not None:
+                bad |= values > high
+        values[bad] = np.nan
+        df[col] = values
+        if bad.any():
+            out_of_range[col] = int(bad.sum())
+    
+    null_masks = {col: df[col].isna().to_numpy() for col in df.columns}
+    return df, null_masks, out_of_range
+
+# Distribution summaries precomputed for /api/distribution
+DISTRIBUTION_BINS = 20
+DISTRIBUTION_PERCENTILES = [1, 5, 10, 25, 50, 75, 90, 95, 99]
+
+def compute_distributions(df, bins=DISTRIBUTION_BINS, percentiles=DISTRIBUTION_PERCENTILES):
+    """
+    Compute histograms and percentiles for every numeric WeatherData column
+    
+    Each column gets one summary over all locations and one per location.
+    Bin edges are shared by all locations of a column so histograms can be
+    compared (and summed) directly.
+    
+    Args:
+        df: DataFrame with database column names
+        bins: Number of histogram bins per column
+        percentiles: Percentiles to precompute (0-100)
+    
+    Returns:
+        List of WeatherDistribution objects
+    """
+    numeric_columns = [
+        column.name for column in WeatherData.__table__.columns
+        if isinstance(column.type, db.Float) and column.name in df.columns
+    ]
+    
+    # Row positions for each location, computed once and reused for every column
+    groups = {None: np.arange(len(df))}
+    if 'location' in df.columns:
+        groups.update(df.groupby('location', sort=True).indices)
+    
+    distributions = []
+    for col in numeric_columns:
+        values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        if not valid.any():
+            continue
+        edges = np.histogram_bin_edges(values[valid], bins=bins)
+        
+        for location, rows in groups.items():
+            group_values = values[rows]
+            group_values = group_values[valid[rows]]
+            if group_values.size == 0:
+                continue
+            counts, _ = np.histogram(group_values, bins=edges)
+            quantiles = np.percentile(group_values, percentiles)
+            distributions.append(WeatherDistribution(
+                column=col,
+                location=location,
+                count=int(group_values.size),
+                bin_edges=[round(float(edge), 4) for edge in edges],
+                bin_counts=counts.tolist(),
+                percentiles=[
+                    {'percentile': float(p), 'value': round(float(q), 4)}
+                    for p, q in zip(percentiles, quantiles)
+                ]
+            ))
+    return distributions
+
 def load_csv_to_database(csv_path, batch_size=1000):
     """
     Load weather data from CSV file into database
@@ -57,6 +169,17 @@ def load_csv_to_database(csv_path, batch_size=1000):
     # Rename columns to match database schema
     df = df.rename(columns=column_mapping)
     
+    # Null out impossible readings in one vectorized pass
+    df, null_masks, out_of_range = validate_weather_frame(df)
+    for col, count in out_of_range.items():
+        logger.info(f"Nulled {count} out-of-range values in {col}")
+    
+    # Convert NaN to None for the database using the null masks
+    records_df = df.astype(object)
+    for col, mask in null_masks.items():
+        if mask.any():
+            records_df[col] = records_df[col].where(~mask, None)
+    
     with app.app_context():
         # Clear existing data (optional)
         logger.info("Clearing existing data...")
@@ -69,17 +192,14 @@ def load_csv_to_database(csv_path, batch_size=1000):
         
         for start_idx in range(0, total_rows, batch_size):
             end_idx = min(start_idx + batch_size, total_rows)
-            batch = df.iloc[start_idx:end_idx]
+            batch = records_df.iloc[start_idx:end_idx]
             
             # Convert batch to list of dictionaries
             records = batch.to_dict('records')
             
             # Create WeatherData objects
             weather_objects = []
-            for record in records:
-                # Convert NaN to None for database
-                cleaned_record = {k: (None if pd.isna(v) else v) for k, v in record.items()}
-                
+            for cleaned_record in records:
                 # Create object with only the fields that exist in the model
                 weather_obj = WeatherData(
                     location=cleaned_record.get('location'),
@@ -114,10 +234,26 @@ def load_csv_to_database(csv_path, batch_size=1000):
             inserted += len(weather_objects)
             logger.info(f"Inserted {inserted}/{total_rows} rows ({inserted/total_rows*100:.1f}%)")
         
+        # Precompute histograms and percentiles while the data is in memory
+        WeatherDistribution.__table__.create(db.engine, checkfirst=True)
+        db.session.query(WeatherDistribution).delete()
+        distributions = compute_distributions(df)
+        db.session.bulk_save_objects(distributions)
+        db.session.commit()
+        logger.info(f"Stored {len(distributions)} distribution summaries")
+        
         # Verify insertion
         count = db.session.query(WeatherData).count()
         logger.info(f"✓ Successfully loaded {count} rows into database")
         
+        # Record the load so replicas in other processes (a running app.py) reload
+        DataLoad.__table__.create(db.engine, checkfirst=True)
+        db.session.add(DataLoad(row_count=count))
+        db.session.commit()
+        
+        # Swap the in-memory replica (if enabled) in this process over to the new data
+        replica.publish()
+        
         # Show sample data
         sample = db.session.query(WeatherData).limit(3).all()
         logger.info("\nSample records:")